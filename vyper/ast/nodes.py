@@ -411,6 +411,15 @@ class VyperNode:
         except KeyError:
             raise UnfoldableNode("not foldable", self)
 
+    def reduced(self) -> "VyperNode":
+        """
+        Return the folded value if one was computed, or the node itself.
+
+        Equivalent to guarding `get_folded_value` with `has_folded_value`,
+        but probes the metadata only once.
+        """
+        return self._metadata.get("folded_value", self)
+
     def _set_folded_value(self, node: "VyperNode") -> None:
         # sanity check this is only called once
         assert "folded_value" not in self._metadata
@@ -477,13 +486,16 @@ class VyperNode:
         With `node_type`: the first matching ascendant node, or `None` if no node
         is found which matches the argument value.
         """
-        if node_type is None or self._parent is None:
+        if node_type is None:
             return self._parent
 
-        if isinstance(self._parent, node_type):
-            return self._parent
+        node = self._parent
+        while node is not None:
+            if isinstance(node, node_type):
+                return node
+            node = node._parent
 
-        return self._parent.get_ancestor(node_type)
+        return None
 
     def get_children(
         self,
@@ -1202,13 +1214,17 @@ class Call(ExprNode):
     @property
     def is_terminus(self):
         # cursed import cycle!
-        from vyper.builtins.functions import get_builtin_functions
+        from vyper.builtins.functions import DISPATCH_TABLE, STMT_DISPATCH_TABLE
 
         if not isinstance(self.func, Name):
             return False
 
         funcname = self.func.id
-        builtin_t = get_builtin_functions().get(funcname)
+        # note: don't use `get_builtin_functions()`, it rebuilds the
+        # merged dispatch table on every call
+        builtin_t = DISPATCH_TABLE.get(funcname)
+        if builtin_t is None:
+            builtin_t = STMT_DISPATCH_TABLE.get(funcname)
         if builtin_t is None:
             return False
 
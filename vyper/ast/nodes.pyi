@@ -31,6 +31,7 @@ class VyperNode:
     @classmethod
     def get_fields(cls: Any) -> set: ...
     def get_folded_value(self) -> ExprNode: ...
+    def reduced(self) -> VyperNode: ...
     def _set_folded_value(self, node: ExprNode) -> None: ...
     @classmethod
     def from_node(cls, node: VyperNode, **kwargs: Any) -> Any: ...
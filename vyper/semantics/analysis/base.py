@@ -1,5 +1,5 @@
 import enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Dict, List, Optional, Union
 
 from vyper import ast as vy_ast
@@ -199,7 +199,7 @@ class ImportInfo(AnalysisResult):
     node: vy_ast.VyperNode
 
 
-@dataclass
+@dataclass(slots=True)
 class VarInfo:
     """
     VarInfo are objects that represent the type of a variable,
@@ -217,14 +217,15 @@ class VarInfo:
     is_public: bool = False
     decl_node: Optional[vy_ast.VyperNode] = None
 
+    # assigned during data position allocation
+    position: Optional[DataPosition] = field(default=None, init=False, repr=False, compare=False)
+    _modification_count: int = field(default=0, init=False, repr=False, compare=False)
+
     def __hash__(self):
         return hash(id(self))
 
-    def __post_init__(self):
-        self._modification_count = 0
-
     def set_position(self, position: DataPosition) -> None:
-        if hasattr(self, "position"):
+        if self.position is not None:
             raise CompilerPanic("Position was already assigned")
         if self.location != position._location:
             if self.location == DataLocation.UNSET:
@@ -7,22 +7,38 @@ class VyperNodeVisitorBase:
     ignored_types: Tuple = ()
     scope_name = ""
 
+    _visitor_fns: dict = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # per-class cache of resolved `visit_*` methods, lazily populated
+        # in `visit()`. this avoids a string format plus `getattr` for
+        # every node visited, which adds up on large modules.
+        cls._visitor_fns: dict = {}
+
     def visit(self, node, *args):
         if isinstance(node, self.ignored_types):
             return
 
-        # iterate over the MRO until we find a matching visitor function
-        # this lets us use a single function to broadly target several
-        # node types with a shared parent
-        for class_ in node.__class__.mro():
-            ast_type = class_.__name__
-
-            with tag_exceptions(node):
-                visitor_fn = getattr(self, f"visit_{ast_type}", None)
-                if visitor_fn:
-                    return visitor_fn(node, *args)
-
-        node_type = type(node).__name__
-        raise StructureException(
-            f"Unsupported syntax for {self.scope_name} namespace: {node_type}", node
-        )
+        node_type = type(node)
+        try:
+            visitor_fn = self._visitor_fns[node_type]
+        except KeyError:
+            # iterate over the MRO until we find a matching visitor function
+            # this lets us use a single function to broadly target several
+            # node types with a shared parent
+            visitor_fn = None
+            for class_ in node_type.mro():
+                visitor_fn = getattr(self, f"visit_{class_.__name__}", None)
+                if visitor_fn is not None:
+                    visitor_fn = visitor_fn.__func__
+                    break
+            type(self)._visitor_fns[node_type] = visitor_fn
+
+        if visitor_fn is None:
+            raise StructureException(
+                f"Unsupported syntax for {self.scope_name} namespace: {node_type.__name__}", node
+            )
+
+        with tag_exceptions(node):
+            return visitor_fn(self, node, *args)
@@ -49,11 +49,16 @@ from vyper.semantics.types import (
 from vyper.semantics.types.function import ContractFunctionT, MemberFunctionT, StateMutability
 from vyper.semantics.types.utils import type_from_annotation
 
+_ENVIRONMENT_VARS = frozenset(CONSTANT_ENVIRONMENT_VARS) | frozenset(MUTABLE_ENVIRONMENT_VARS)
+
+# builtins which are allowed to consume `msg.data`
+_MSG_DATA_BUILTINS = frozenset(("slice", "len", "raw_call"))
+
 
 def validate_functions(vy_module: vy_ast.Module) -> None:
     """Analyzes a vyper ast and validates the function bodies"""
 
-    err_list = ExceptionList()
+    errs: list = []
     namespace = get_namespace()
     for node in vy_module.get_children(vy_ast.FunctionDef):
         with namespace.enter_scope():
@@ -61,9 +66,10 @@ def validate_functions(vy_module: vy_ast.Module) -> None:
                 analyzer = FunctionNodeVisitor(vy_module, node, namespace)
                 analyzer.analyze()
             except VyperException as e:
-                err_list.append(e)
+                errs.append(e)
 
-    err_list.raise_if_not_empty()
+    if errs:
+        ExceptionList(errs).raise_if_not_empty()
 
 
 # finds the terminus node for a list of nodes.
@@ -98,38 +104,56 @@ def find_terminating_node(node_list: list) -> Optional[vy_ast.VyperNode]:
 def _check_iterator_modification(
     target_node: vy_ast.VyperNode, search_node: vy_ast.VyperNode
 ) -> Optional[vy_ast.VyperNode]:
-    similar_nodes = [
-        n
-        for n in search_node.get_descendants(type(target_node))
-        if vy_ast.compare_nodes(target_node, n)
-    ]
-
-    for node in similar_nodes:
-        # raise if the node is the target of an assignment statement
-        assign_node = node.get_ancestor((vy_ast.Assign, vy_ast.AugAssign))
-        # note the use of get_descendants() blocks statements like
-        # self.my_array[i] = x
-        if assign_node and node in assign_node.target.get_descendants(include_self=True):
-            return node
-
-        attr_node = node.get_ancestor(vy_ast.Attribute)
-        # note the use of get_descendants() blocks statements like
-        # self.my_array[i].append(x)
-        if (
-            attr_node is not None
-            and node in attr_node.value.get_descendants(include_self=True)
-            and attr_node.attr in ("append", "pop", "extend")
-        ):
-            return node
+    # find nodes which (might) modify the value of `target_node` with a
+    # single top-down pass, instead of scanning the ancestor chain for
+    # every node which resembles `target_node`.
+    target_type = type(target_node)
+
+    # `in_assign_target` is True while inside the target of an assignment;
+    # anything under the target counts, which blocks statements like
+    # `self.my_array[i] = x`.
+    # `in_modified_attr` is True while inside the value of a modifying
+    # attribute access, which blocks statements like
+    # `self.my_array[i].append(x)`. it is recomputed at every attribute
+    # access, mirroring the nearest-`Attribute`-ancestor check.
+    def _walk(node, in_assign_target, in_modified_attr):
+        if (in_assign_target or in_modified_attr) and isinstance(node, target_type):
+            if vy_ast.compare_nodes(target_node, node):
+                return node
+
+        if isinstance(node, (vy_ast.Assign, vy_ast.AugAssign)):
+            return _walk(node.target, True, in_modified_attr) or _walk(
+                node.value, False, in_modified_attr
+            )
+
+        if isinstance(node, vy_ast.Attribute):
+            in_modified_attr = node.attr in ("append", "pop", "extend")
+            return _walk(node.value, in_assign_target, in_modified_attr)
+
+        for child in node.get_children():
+            ret = _walk(child, in_assign_target, in_modified_attr)
+            if ret is not None:
+                return ret
+
+        return None
+
+    return _walk(search_node, False, False)
 
-    return None
+
+def _contains_self_reference(node: vy_ast.VyperNode) -> bool:
+    # equivalent to `len(node.get_descendants(vy_ast.Name, {"id": "self"})) > 0`
+    # but short-circuits instead of materializing the descendant list
+    if isinstance(node, vy_ast.Name):
+        return node.id == "self"
+    return any(_contains_self_reference(i) for i in node.get_children())
 
 
 # helpers
-def _validate_address_code(node: vy_ast.Attribute, value_type: VyperType) -> None:
+def _validate_address_code(
+    node: vy_ast.Attribute, parent: vy_ast.VyperNode, value_type: VyperType
+) -> None:
     if isinstance(value_type, AddressT) and node.attr == "code":
         # Validate `slice(<address>.code, start, length)` where `length` is constant
-        parent = node.get_ancestor()
         if isinstance(parent, vy_ast.Call):
             ok_func = isinstance(parent.func, vy_ast.Name) and parent.func.id == "slice"
             ok_args = len(parent.args) == 3 and isinstance(parent.args[2], vy_ast.Int)
@@ -141,15 +165,17 @@ def _validate_address_code(node: vy_ast.Attribute, value_type: VyperType) -> Non
         )
 
 
-def _validate_msg_data_attribute(node: vy_ast.Attribute) -> None:
+def _validate_msg_data_attribute(node: vy_ast.Attribute, parent: vy_ast.VyperNode) -> None:
     if isinstance(node.value, vy_ast.Name) and node.value.id == "msg" and node.attr == "data":
-        parent = node.get_ancestor()
-        allowed_builtins = ("slice", "len", "raw_call")
-        if not isinstance(parent, vy_ast.Call) or parent.get("func.id") not in allowed_builtins:
+        if (
+            not isinstance(parent, vy_ast.Call)
+            or not isinstance(parent.func, vy_ast.Name)
+            or parent.func.id not in _MSG_DATA_BUILTINS
+        ):
             raise StructureException(
                 "msg.data is only allowed inside of the slice, len or raw_call functions", node
             )
-        if parent.get("func.id") == "slice":
+        if parent.func.id == "slice":
             ok_args = len(parent.args) == 3 and isinstance(parent.args[2], vy_ast.Int)
             if not ok_args:
                 raise StructureException(
@@ -163,8 +189,7 @@ def _validate_msg_value_access(node: vy_ast.Attribute) -> None:
 
 
 def _validate_pure_access(node: vy_ast.Attribute, typ: VyperType) -> None:
-    env_vars = set(CONSTANT_ENVIRONMENT_VARS.keys()) | set(MUTABLE_ENVIRONMENT_VARS.keys())
-    if isinstance(node.value, vy_ast.Name) and node.value.id in env_vars:
+    if isinstance(node.value, vy_ast.Name) and node.value.id in _ENVIRONMENT_VARS:
         if isinstance(typ, ContractFunctionT) and typ.mutability == StateMutability.PURE:
             return
 
@@ -221,11 +246,18 @@ class FunctionNodeVisitor(VyperNodeVisitorBase):
         for kwarg in self.func.keyword_args:
             self.expr_visitor.visit(kwarg.default_value, kwarg.typ)
 
-    def visit(self, node):
-        super().visit(node)
-
-    def visit_AnnAssign(self, node):
-        name = node.get("target.id")
+    def _function_defs_by_name(self) -> dict:
+        # index the module's function defs by name, so repeated lookups
+        # don't need to rescan the module body. cached in the module
+        # metadata since the index is shared across function analyses.
+        module = self.vyper_module
+        if "function_defs_by_name" not in module._metadata:
+            fn_nodes = module.get_children(vy_ast.FunctionDef)
+            module._metadata["function_defs_by_name"] = {fn.name: fn for fn in fn_nodes}
+        return module._metadata["function_defs_by_name"]
+
+    def visit_AnnAssign(self, node: vy_ast.AnnAssign) -> None:
+        name = node.target.id if isinstance(node.target, vy_ast.Name) else None
         if name is None:
             raise VariableDeclarationException("Invalid assignment", node)
 
@@ -239,7 +271,10 @@ class FunctionNodeVisitor(VyperNodeVisitorBase):
 
         self.namespace[name] = VarInfo(typ, location=DataLocation.MEMORY)
 
-        self.expr_visitor.visit(node.target, typ)
+        # the target is always a bare `Name` (checked above) which was just
+        # bound to `typ`, so a full `ExprVisitor` dispatch reduces to the
+        # metadata annotation
+        node.target._metadata["type"] = typ
         self.expr_visitor.visit(node.value, typ)
 
     def _validate_revert_reason(self, msg_node: vy_ast.VyperNode) -> None:
@@ -255,7 +290,7 @@ class FunctionNodeVisitor(VyperNodeVisitorBase):
             self.expr_visitor.visit(msg_node, get_exact_type_from_node(msg_node))
         # CMC 2023-10-19 nice to have: tag UNREACHABLE nodes with a special type
 
-    def visit_Assert(self, node):
+    def visit_Assert(self, node: vy_ast.Assert) -> None:
         if node.msg:
             self._validate_revert_reason(node.msg)
 
@@ -280,26 +315,34 @@ class FunctionNodeVisitor(VyperNodeVisitorBase):
         target.validate_modification(node, self.func.mutability)
 
         self.expr_visitor.visit(node.value, target.typ)
-        self.expr_visitor.visit(node.target, target.typ)
 
-    def visit_Assign(self, node):
+        # for a bare `Name` target the expr visitor would just re-validate
+        # the type it was resolved with and annotate metadata; inline the
+        # annotation and skip the dispatch. `self` still takes the full
+        # path so the pure-function reference check runs.
+        if isinstance(node.target, vy_ast.Name) and node.target.id != "self":
+            node.target._metadata["type"] = target.typ
+        else:
+            self.expr_visitor.visit(node.target, target.typ)
+
+    def visit_Assign(self, node: vy_ast.Assign) -> None:
         self._assign_helper(node)
 
-    def visit_AugAssign(self, node):
+    def visit_AugAssign(self, node: vy_ast.AugAssign) -> None:
         self._assign_helper(node)
 
-    def visit_Break(self, node):
+    def visit_Break(self, node: vy_ast.Break) -> None:
         for_node = node.get_ancestor(vy_ast.For)
         if for_node is None:
             raise StructureException("`break` must be enclosed in a `for` loop", node)
 
-    def visit_Continue(self, node):
+    def visit_Continue(self, node: vy_ast.Continue) -> None:
         # TODO: use context/state instead of ast search
         for_node = node.get_ancestor(vy_ast.For)
         if for_node is None:
             raise StructureException("`continue` must be enclosed in a `for` loop", node)
 
-    def visit_Expr(self, node):
+    def visit_Expr(self, node: vy_ast.Expr) -> None:
         if isinstance(node.value, vy_ast.Ellipsis):
             raise StructureException(
                 "`...` is not allowed in `.vy` files! "
@@ -352,7 +395,7 @@ class FunctionNodeVisitor(VyperNodeVisitorBase):
             )
         self.expr_visitor.visit(node.value, fn_type)
 
-    def visit_For(self, node):
+    def visit_For(self, node: vy_ast.For) -> None:
         if not isinstance(node.target.target, vy_ast.Name):
             raise StructureException("Invalid syntax for loop iterator", node.target.target)
 
@@ -360,7 +403,7 @@ class FunctionNodeVisitor(VyperNodeVisitorBase):
 
         if isinstance(node.iter, vy_ast.Call):
             # iteration via range()
-            if node.iter.get("func.id") != "range":
+            if not isinstance(node.iter.func, vy_ast.Name) or node.iter.func.id != "range":
                 raise IteratorException(
                     "Cannot iterate over the result of a function call", node.iter
                 )
@@ -368,7 +411,7 @@ class FunctionNodeVisitor(VyperNodeVisitorBase):
 
         else:
             # iteration over a variable or literal list
-            iter_val = node.iter.get_folded_value() if node.iter.has_folded_value else node.iter
+            iter_val = node.iter.reduced()
             if isinstance(iter_val, vy_ast.List) and len(iter_val.elements) == 0:
                 raise StructureException("For loop must have at least 1 iteration", node.iter)
 
@@ -383,22 +426,40 @@ class FunctionNodeVisitor(VyperNodeVisitorBase):
             if assign:
                 raise ImmutableViolation("Cannot modify array during iteration", assign)
 
-        # Check if `iter` is a storage variable. get_descendants` is used to check for
-        # nested `self` (e.g. structs)
+        # Check if `iter` is a storage variable. the descendant walk is used
+        # to check for nested `self` (e.g. structs)
         # NOTE: this analysis will be borked once stateful modules are allowed!
-        iter_is_storage_var = (
-            isinstance(node.iter, vy_ast.Attribute)
-            and len(node.iter.get_descendants(vy_ast.Name, {"id": "self"})) > 0
+        iter_is_storage_var = isinstance(node.iter, vy_ast.Attribute) and _contains_self_reference(
+            node.iter
         )
 
         if iter_is_storage_var:
             # check if iterated value may be modified by function calls inside the loop
             iter_name = node.iter.attr
-            for call_node in node.get_descendants(vy_ast.Call, {"func.value.id": "self"}):
+
+            fn_node_by_name = self._function_defs_by_name()
+
+            # memoize results per function body - the same function can show
+            # up in the reachable set of several call sites within the loop
+            checked: dict = {}
+
+            def _modifies_iter(fn_node):
+                if fn_node.name not in checked:
+                    checked[fn_node.name] = _check_iterator_modification(node.iter, fn_node)
+                return checked[fn_node.name]
+
+            self_calls = [
+                n
+                for n in node.get_descendants(vy_ast.Call)
+                if isinstance(n.func, vy_ast.Attribute)
+                and isinstance(n.func.value, vy_ast.Name)
+                and n.func.value.id == "self"
+            ]
+            for call_node in self_calls:
                 fn_name = call_node.func.attr
 
-                fn_node = self.vyper_module.get_children(vy_ast.FunctionDef, {"name": fn_name})[0]
-                if _check_iterator_modification(node.iter, fn_node):
+                fn_node = fn_node_by_name[fn_name]
+                if _modifies_iter(fn_node):
                     # check for direct modification
                     raise ImmutableViolation(
                         f"Cannot call '{fn_name}' inside for loop, it potentially "
@@ -411,8 +472,8 @@ class FunctionNodeVisitor(VyperNodeVisitorBase):
                 ):
                     # check for indirect modification
                     name = reachable_t.name
-                    fn_node = self.vyper_module.get_children(vy_ast.FunctionDef, {"name": name})[0]
-                    if _check_iterator_modification(node.iter, fn_node):
+                    fn_node = fn_node_by_name[name]
+                    if _modifies_iter(fn_node):
                         raise ImmutableViolation(
                             f"Cannot call '{fn_name}' inside for loop, it may call to '{name}' "
                             f"which potentially modifies iterated storage variable '{iter_name}'",
@@ -442,7 +503,7 @@ class FunctionNodeVisitor(VyperNodeVisitorBase):
                 iter_type = get_exact_type_from_node(node.iter)
                 self.expr_visitor.visit(node.iter, iter_type)
 
-    def visit_If(self, node):
+    def visit_If(self, node: vy_ast.If) -> None:
         validate_expected_type(node.test, BoolT())
         self.expr_visitor.visit(node.test, BoolT())
         with self.namespace.enter_scope():
@@ -452,7 +513,7 @@ class FunctionNodeVisitor(VyperNodeVisitorBase):
             for n in node.orelse:
                 self.visit(n)
 
-    def visit_Log(self, node):
+    def visit_Log(self, node: vy_ast.Log) -> None:
         if not isinstance(node.value, vy_ast.Call):
             raise StructureException("Log must call an event", node)
         f = get_exact_type_from_node(node.value.func)
@@ -466,11 +527,11 @@ class FunctionNodeVisitor(VyperNodeVisitorBase):
         node._metadata["type"] = f.typedef
         self.expr_visitor.visit(node.value, f.typedef)
 
-    def visit_Raise(self, node):
+    def visit_Raise(self, node: vy_ast.Raise) -> None:
         if node.exc:
             self._validate_revert_reason(node.exc)
 
-    def visit_Return(self, node):
+    def visit_Return(self, node: vy_ast.Return) -> None:
         values = node.value
         if values is None:
             if self.func.return_type:
@@ -501,6 +562,12 @@ class ExprVisitor(VyperNodeVisitorBase):
 
     def __init__(self, fn_node: Optional[ContractFunctionT] = None):
         self.func = fn_node
+        # precompute the mutability checks applied at every attribute and
+        # name node so the enum comparisons don't run per node
+        self._check_msg_value = fn_node is not None and (
+            fn_node.mutability != StateMutability.PAYABLE
+        )
+        self._check_pure = fn_node is not None and fn_node.mutability == StateMutability.PURE
 
     def visit(self, node, typ):
         # recurse and typecheck in case we are being fed the wrong type for
@@ -516,47 +583,66 @@ class ExprVisitor(VyperNodeVisitorBase):
         # annotate
         node._metadata["type"] = typ
 
-        # validate and annotate folded value
-        if node.has_folded_value:
-            folded_node = node.get_folded_value()
-            self.visit(folded_node, typ)
+        # validate and annotate folded value. read the metadata directly
+        # so the node is probed once, not once for `has_folded_value` and
+        # again for `get_folded_value`.
+        folded_node = node._metadata.get("folded_value")
+        if folded_node is not None:
+            if isinstance(folded_node, vy_ast.Constant):
+                # fast path: folded values are almost always simple
+                # constants, which only need expected-type validation.
+                # skip the second dispatch through `visit` (folded nodes
+                # never have folded values of their own).
+                self.visit_Constant(folded_node, typ)
+                folded_node._metadata["type"] = typ
+            else:
+                self.visit(folded_node, typ)
+
+    def _validate_and_visit(self, node, typ):
+        # `visit_Constant` and `visit_Name` call `validate_expected_type`
+        # themselves, so pre-validating those nodes would run the exact
+        # same check twice. other node types keep the explicit check,
+        # since their visitors only validate their children.
+        if not isinstance(node, (vy_ast.Constant, vy_ast.Name)):
+            validate_expected_type(node, typ)
+        self.visit(node, typ)
 
     def visit_Attribute(self, node: vy_ast.Attribute, typ: VyperType) -> None:
-        _validate_msg_data_attribute(node)
+        # fetch the parent once and thread it through the validators so
+        # they don't each walk the ancestor chain on every attribute node
+        parent = node.get_ancestor()
+
+        _validate_msg_data_attribute(node, parent)
 
         # CMC 2023-10-19 TODO generalize this to mutability check on every node.
         # something like,
         # if self.func.mutability < expr_info.mutability:
         #    raise ...
 
-        if self.func and self.func.mutability != StateMutability.PAYABLE:
+        if self._check_msg_value:
             _validate_msg_value_access(node)
 
-        if self.func and self.func.mutability == StateMutability.PURE:
+        if self._check_pure:
             _validate_pure_access(node, typ)
 
         value_type = get_exact_type_from_node(node.value)
-        _validate_address_code(node, value_type)
+        _validate_address_code(node, parent, value_type)
 
         self.visit(node.value, value_type)
 
     def visit_BinOp(self, node: vy_ast.BinOp, typ: VyperType) -> None:
-        validate_expected_type(node.left, typ)
-        self.visit(node.left, typ)
+        self._validate_and_visit(node.left, typ)
 
         rtyp = typ
         if isinstance(node.op, (vy_ast.LShift, vy_ast.RShift)):
-            rtyp = get_possible_types_from_node(node.right).pop()
-
-        validate_expected_type(node.right, rtyp)
+            rtyp = get_possible_types_from_node(node.right)[-1]
 
-        self.visit(node.right, rtyp)
+        self._validate_and_visit(node.right, rtyp)
 
     def visit_BoolOp(self, node: vy_ast.BoolOp, typ: VyperType) -> None:
         assert typ == BoolT()  # sanity check
         for value in node.values:
-            validate_expected_type(value, BoolT())
-            self.visit(value, BoolT())
+            self._validate_and_visit(value, BoolT())
 
     def visit_Call(self, node: vy_ast.Call, typ: VyperType) -> None:
         call_type = get_exact_type_from_node(node.func)
@@ -565,48 +651,70 @@ class ExprVisitor(VyperNodeVisitorBase):
         # and kwargs via `call_type.fetch_call_return`
         self.visit(node.func, call_type)
 
-        if isinstance(call_type, ContractFunctionT):
-            # function calls
-            if self.func and call_type.is_internal:
-                self.func.called_functions.add(call_type)
-            for arg, typ in zip(node.args, call_type.argument_types):
-                self.visit(arg, typ)
-            for kwarg in node.keywords:
-                # We should only see special kwargs
-                typ = call_type.call_site_kwargs[kwarg.arg].typ
-                self.visit(kwarg.value, typ)
+        # dispatch on the exact call type - cheaper than an isinstance
+        # chain per call expression. falls through to the builtin path
+        # for anything not in the table.
+        handler = self._call_handlers.get(type(call_type), ExprVisitor._visit_builtin_call)
+        handler(self, node, call_type, typ)
 
-        elif is_type_t(call_type, EventT):
+    def _visit_contract_fn_call(
+        self, node: vy_ast.Call, call_type: ContractFunctionT, typ: VyperType
+    ) -> None:
+        # function calls
+        if self.func and call_type.is_internal:
+            self.func.called_functions.add(call_type)
+        for arg, typ in zip(node.args, call_type.argument_types):
+            self.visit(arg, typ)
+        for kwarg in node.keywords:
+            # We should only see special kwargs
+            typ = call_type.call_site_kwargs[kwarg.arg].typ
+            self.visit(kwarg.value, typ)
+
+    def _visit_member_fn_call(
+        self, node: vy_ast.Call, call_type: MemberFunctionT, typ: VyperType
+    ) -> None:
+        assert len(node.args) == len(call_type.arg_types)
+        for arg, arg_type in zip(node.args, call_type.arg_types):
+            self.visit(arg, arg_type)
+
+    def _visit_type_t_call(self, node: vy_ast.Call, call_type: TYPE_T, typ: VyperType) -> None:
+        if isinstance(call_type.typedef, EventT):
             # events have no kwargs
             expected_types = call_type.typedef.arguments.values()
             for arg, typ in zip(node.args, expected_types):
                 self.visit(arg, typ)
-        elif is_type_t(call_type, StructT):
+        elif isinstance(call_type.typedef, StructT):
             # struct ctors
             # ctors have no kwargs
             expected_types = call_type.typedef.members.values()
             for value, arg_type in zip(node.args[0].values, expected_types):
                 self.visit(value, arg_type)
-        elif isinstance(call_type, MemberFunctionT):
-            assert len(node.args) == len(call_type.arg_types)
-            for arg, arg_type in zip(node.args, call_type.arg_types):
-                self.visit(arg, arg_type)
         else:
-            # builtin functions
-            arg_types = call_type.infer_arg_types(node, expected_return_typ=typ)
-            # `infer_arg_types` already calls `validate_expected_type`
-            for arg, arg_type in zip(node.args, arg_types):
-                self.visit(arg, arg_type)
-            kwarg_types = call_type.infer_kwarg_types(node)
-            for kwarg in node.keywords:
-                self.visit(kwarg.value, kwarg_types[kwarg.arg])
+            # type ctors, e.g. `uint256(1)`
+            self._visit_builtin_call(node, call_type, typ)
+
+    def _visit_builtin_call(self, node: vy_ast.Call, call_type, typ: VyperType) -> None:
+        # builtin functions
+        arg_types = call_type.infer_arg_types(node, expected_return_typ=typ)
+        # `infer_arg_types` already calls `validate_expected_type`
+        for arg, arg_type in zip(node.args, arg_types):
+            self.visit(arg, arg_type)
+        kwarg_types = call_type.infer_kwarg_types(node)
+        for kwarg in node.keywords:
+            self.visit(kwarg.value, kwarg_types[kwarg.arg])
+
+    _call_handlers = {
+        ContractFunctionT: _visit_contract_fn_call,
+        MemberFunctionT: _visit_member_fn_call,
+        TYPE_T: _visit_type_t_call,
+    }
 
     def visit_Compare(self, node: vy_ast.Compare, typ: VyperType) -> None:
         if isinstance(node.op, (vy_ast.In, vy_ast.NotIn)):
             # membership in list literal - `x in [a, b, c]`
             # needle: ltyp, haystack: rtyp
             if isinstance(node.right, vy_ast.List):
-                ltyp = get_common_types(node.left, *node.right.elements).pop()
+                ltyp = get_common_types(node.left, *node.right.elements)[-1]
 
                 rlen = len(node.right.elements)
                 rtyp = SArrayT(ltyp, rlen)
@@ -621,14 +729,12 @@ class ExprVisitor(VyperNodeVisitorBase):
                     assert isinstance(rtyp, (SArrayT, DArrayT))
                     ltyp = rtyp.value_type
 
-            validate_expected_type(node.left, ltyp)
-
-            self.visit(node.left, ltyp)
+            self._validate_and_visit(node.left, ltyp)
             self.visit(node.right, rtyp)
 
         else:
             # ex. a < b
-            cmp_typ = get_common_types(node.left, node.right).pop()
+            cmp_typ = get_common_types(node.left, node.right)[-1]
             if isinstance(cmp_typ, _BytestringT):
                 # for bytestrings, get_common_types automatically downcasts
                 # to the smaller common type - that will annotate with the
@@ -636,29 +742,26 @@ class ExprVisitor(VyperNodeVisitorBase):
                 # resolves to the right type for bytestrings anyways).
                 ltyp = get_exact_type_from_node(node.left)
                 rtyp = get_exact_type_from_node(node.right)
+                self.visit(node.left, ltyp)
+                self.visit(node.right, rtyp)
             else:
                 ltyp = rtyp = cmp_typ
-                validate_expected_type(node.left, ltyp)
-                validate_expected_type(node.right, rtyp)
-
-            self.visit(node.left, ltyp)
-            self.visit(node.right, rtyp)
+                self._validate_and_visit(node.left, ltyp)
+                self._validate_and_visit(node.right, rtyp)
 
     def visit_Constant(self, node: vy_ast.Constant, typ: VyperType) -> None:
         validate_expected_type(node, typ)
 
     def visit_Index(self, node: vy_ast.Index, typ: VyperType) -> None:
-        validate_expected_type(node.value, typ)
-        self.visit(node.value, typ)
+        self._validate_and_visit(node.value, typ)
 
     def visit_List(self, node: vy_ast.List, typ: VyperType) -> None:
         assert isinstance(typ, (SArrayT, DArrayT))
         for element in node.elements:
-            validate_expected_type(element, typ.value_type)
-            self.visit(element, typ.value_type)
+            self._validate_and_visit(element, typ.value_type)
 
     def visit_Name(self, node: vy_ast.Name, typ: VyperType) -> None:
-        if self.func and self.func.mutability == StateMutability.PURE:
+        if self._check_pure:
             _validate_self_reference(node)
 
         if not isinstance(typ, TYPE_T):
@@ -688,7 +791,7 @@ class ExprVisitor(VyperNodeVisitorBase):
         # not be exactly base_type.key_type
         # note: index_type is validated in types_from_Subscript
         index_types = get_possible_types_from_node(node.slice.value)
-        index_type = index_types.pop()
+        index_type = index_types[-1]
 
         self.visit(node.slice, index_type)
         self.visit(node.value, base_type)
@@ -700,20 +803,15 @@ class ExprVisitor(VyperNodeVisitorBase):
 
         assert isinstance(typ, TupleT)
         for element, subtype in zip(node.elements, typ.member_types):
-            validate_expected_type(element, subtype)
-            self.visit(element, subtype)
+            self._validate_and_visit(element, subtype)
 
     def visit_UnaryOp(self, node: vy_ast.UnaryOp, typ: VyperType) -> None:
-        validate_expected_type(node.operand, typ)
-        self.visit(node.operand, typ)
+        self._validate_and_visit(node.operand, typ)
 
     def visit_IfExp(self, node: vy_ast.IfExp, typ: VyperType) -> None:
-        validate_expected_type(node.test, BoolT())
-        self.visit(node.test, BoolT())
-        validate_expected_type(node.body, typ)
-        self.visit(node.body, typ)
-        validate_expected_type(node.orelse, typ)
-        self.visit(node.orelse, typ)
+        self._validate_and_visit(node.test, BoolT())
+        self._validate_and_visit(node.body, typ)
+        self._validate_and_visit(node.orelse, typ)
 
 
 def _validate_range_call(node: vy_ast.Call):
@@ -722,16 +820,14 @@ def _validate_range_call(node: vy_ast.Call):
     :param node: call to range()
     :return: None
     """
-    assert node.func.get("id") == "range"
+    assert isinstance(node.func, vy_ast.Name) and node.func.id == "range"
     validate_call_args(node, (1, 2), kwargs=["bound"])
     kwargs = {s.arg: s.value for s in node.keywords or []}
     start, end = (vy_ast.Int(value=0), node.args[0]) if len(node.args) == 1 else node.args
-    start, end = [i.get_folded_value() if i.has_folded_value else i for i in (start, end)]
+    start, end = [i.reduced() for i in (start, end)]
 
     if "bound" in kwargs:
-        bound = kwargs["bound"]
-        if bound.has_folded_value:
-            bound = bound.get_folded_value()
+        bound = kwargs["bound"].reduced()
         if not isinstance(bound, vy_ast.Num):
             raise StateAccessViolation("Bound must be a literal", bound)
         if bound.value <= 0:
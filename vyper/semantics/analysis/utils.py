@@ -171,13 +171,24 @@ class _ExprAnalyser:
 
         return node._metadata[k].copy()
 
+    # cache of node type -> types_from_* function, shared across instances
+    _find_fn_cache: dict = {}
+
     def _find_fn(self, node):
+        node_type = type(node)
+        try:
+            fn = self._find_fn_cache[node_type]
+            return fn.__get__(self)
+        except KeyError:
+            pass
+
         # look for a type-check method for each class in the given class mro
-        for name in [i.__name__ for i in type(node).mro()]:
+        for name in [i.__name__ for i in node_type.mro()]:
             if name == "VyperNode":
                 break
             fn = getattr(self, f"types_from_{name}", None)
             if fn is not None:
+                self._find_fn_cache[node_type] = fn.__func__
                 return fn
 
         raise StructureException("Cannot determine type of this object", node)
@@ -496,10 +507,11 @@ def get_common_types(*nodes: vy_ast.VyperNode, filter_fn: Callable = None) -> Li
     list
         List of zero or more `BaseType` objects.
     """
-    common_types = _ExprAnalyser().get_possible_types_from_node(nodes[0])
+    analyser = _ExprAnalyser()
+    common_types = analyser.get_possible_types_from_node(nodes[0])
 
     for item in nodes[1:]:
-        new_types = _ExprAnalyser().get_possible_types_from_node(item)
+        new_types = analyser.get_possible_types_from_node(item)
 
         common = [i for i in common_types if _is_type_in_list(i, new_types)]
 
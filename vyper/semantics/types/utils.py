@@ -182,8 +182,8 @@ def get_index_value(node: vy_ast.Index) -> int:
     from vyper.semantics.analysis.utils import get_possible_types_from_node
 
     value = node.get("value")
-    if value.has_folded_value:
-        value = value.get_folded_value()
+    if value is not None:
+        value = value.reduced()
 
     if not isinstance(value, vy_ast.Int):
         if hasattr(node, "value"):